@@ -0,0 +1,98 @@
+"""Benchmark emergency alert fan-out.
+
+In-process mode (default) measures the hub itself: publish-to-delivery latency
+across N subscribers and memory held per subscriber.
+
+    python scripts/bench_alert_fanout.py --subscribers 5000 --alerts 50
+
+Live mode opens real WebSocket connections against a running worker to find
+how many responders one worker can hold and how long a POST takes to reach
+all of them. The token must belong to a superuser.
+
+    python scripts/bench_alert_fanout.py --url ws://localhost:8000/emergency/ws \
+        --token <jwt> --subscribers 2000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "backend"))
+
+
+def report(label: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1] if len(samples) >= 100 else samples[-1]
+    print(
+        f"{label}: n={len(samples)} mean={statistics.mean(samples) * 1000:.2f}ms "
+        f"p50={statistics.median(samples) * 1000:.2f}ms p99={p99 * 1000:.2f}ms"
+    )
+
+
+async def bench_hub(subscribers: int, alerts: int) -> None:
+    from app.core.alerts import AlertHub, LocalBroadcast
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    hub = AlertHub(LocalBroadcast())
+    subs = [hub.subscribe() for _ in range(subscribers)]
+    after = tracemalloc.take_snapshot()
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    tracemalloc.stop()
+    print(f"{subscribers} subscribers, ~{used / subscribers:.0f} bytes each")
+
+    latencies = []
+    for i in range(alerts):
+        start = time.perf_counter()
+        await hub.publish({"id": i, "summary": "bench"})
+        await asyncio.gather(*(sub.queue.get() for sub in subs))
+        latencies.append(time.perf_counter() - start)
+    report("fan-out to all subscribers", latencies)
+
+
+async def bench_live(url: str, token: str, subscribers: int, alerts: int, api: str) -> None:
+    import httpx
+    import websockets
+
+    conns = []
+    try:
+        for _ in range(subscribers):
+            conns.append(await websockets.connect(f"{url}?token={token}"))
+    except Exception as exc:
+        print(f"connection {len(conns) + 1} failed: {exc!r}")
+    print(f"holding {len(conns)} connections")
+    if not conns:
+        return
+
+    latencies = []
+    async with httpx.AsyncClient(base_url=api, headers={"Authorization": f"Bearer {token}"}) as client:
+        for i in range(alerts):
+            start = time.perf_counter()
+            resp = await client.post("/emergency/alert", json={"summary": f"bench {i}"})
+            resp.raise_for_status()
+            await asyncio.gather(*(conn.recv() for conn in conns))
+            latencies.append(time.perf_counter() - start)
+    report("POST to last responder", latencies)
+    await asyncio.gather(*(conn.close() for conn in conns))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--alerts", type=int, default=20)
+    parser.add_argument("--url", help="WebSocket URL of a running worker")
+    parser.add_argument("--token", help="JWT of a superuser (live mode)")
+    parser.add_argument("--api", default="http://localhost:8000", help="HTTP base URL (live mode)")
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(bench_live(args.url, args.token, args.subscribers, args.alerts, args.api))
+    else:
+        asyncio.run(bench_hub(args.subscribers, args.alerts))
+
+
+if __name__ == "__main__":
+    main()
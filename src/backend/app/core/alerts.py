@@ -0,0 +1,117 @@
+import asyncio
+import importlib
+import json
+import logging
+from concurrent.futures import Future
+from typing import Protocol
+
+from .config import get_settings
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class BroadcastBackend(Protocol):
+    """Carries published alerts between workers.
+
+    Every worker subscribes its hub to the backend; a publish on any worker
+    must be delivered to every subscribed hub, including the publisher's own.
+    """
+
+    async def publish(self, message: str) -> None: ...
+
+    def subscribe(self, callback) -> None: ...
+
+
+class LocalBroadcast:
+    """Single-process stand-in for a cross-worker backend (Redis, Postgres NOTIFY, ...)."""
+
+    def __init__(self):
+        self._callbacks = []
+
+    async def publish(self, message: str) -> None:
+        for callback in self._callbacks:
+            callback(message)
+
+    def subscribe(self, callback) -> None:
+        self._callbacks.append(callback)
+
+
+class Subscriber:
+    """One connected responder. Holds a bounded queue of pending messages."""
+
+    def __init__(self, max_queue: int):
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def offer(self, message: str) -> None:
+        # Slow clients must never stall the fan-out: when the queue is full the
+        # oldest pending alert is discarded so the newest one is always delivered.
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    def take_dropped(self) -> int:
+        """Alerts discarded since the last call, so the client can be told about the gap."""
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+def load_backend(path: str) -> BroadcastBackend:
+    """Instantiate a backend from a dotted path such as ``app.core.alerts.LocalBroadcast``."""
+    module, _, name = path.rpartition(".")
+    return getattr(importlib.import_module(module), name)()
+
+
+class AlertHub:
+    """In-process pub/sub hub fanning emergency alerts out to WebSocket clients."""
+
+    def __init__(self, backend: BroadcastBackend | None = None, max_queue: int | None = None):
+        self.backend: BroadcastBackend | None = None
+        self.max_queue = max_queue or settings.alert_queue_size
+        self.subscribers: set[Subscriber] = set()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        if backend is not None:
+            self.use(backend)
+
+    def use(self, backend: BroadcastBackend) -> None:
+        self.backend = backend
+        self.backend.subscribe(self._deliver)
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Attach to the server loop at startup, building the configured backend if none was given."""
+        self.loop = loop
+        if self.backend is None:
+            self.use(load_backend(settings.alert_broadcast_backend))
+
+    def subscribe(self) -> Subscriber:
+        sub = Subscriber(self.max_queue)
+        self.subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        self.subscribers.discard(sub)
+
+    def _deliver(self, message: str) -> None:
+        for sub in tuple(self.subscribers):
+            sub.offer(message)
+
+    async def publish(self, payload: dict) -> None:
+        await self.backend.publish(json.dumps(payload))
+
+    def publish_threadsafe(self, payload: dict) -> None:
+        """Publish from a sync route running in the threadpool."""
+        if self.loop is None or self.loop.is_closed():
+            return
+        future = asyncio.run_coroutine_threadsafe(self.publish(payload), self.loop)
+        future.add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if not future.cancelled() and (exc := future.exception()) is not None:
+            logger.error("Emergency alert broadcast failed", exc_info=exc)
+
+
+hub = AlertHub()
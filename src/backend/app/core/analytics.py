@@ -0,0 +1,113 @@
+import re
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models.triage import TriageEvent, TriageRollup
+
+
+# Fixed vocabulary keeps the keyword dimension small and comparable across regions.
+SYMPTOM_KEYWORDS = (
+    "fever", "cough", "headache", "chest pain", "shortness of breath", "sore throat",
+    "vomiting", "diarrhea", "rash", "fatigue", "dizziness", "abdominal pain",
+    "bleeding", "seizure", "back pain", "nausea", "body aches", "runny nose",
+)
+
+KEYWORD_PATTERNS = {kw: re.compile(rf"\b{re.escape(kw)}\b") for kw in SYMPTOM_KEYWORDS}
+
+# Region is sent by anonymous callers, so it is mapped onto a closed list to keep
+# the rollup table bounded; anything unrecognised is counted as OTHER_REGION.
+REGIONS = (
+    "Eastern Cape", "Free State", "Gauteng", "KwaZulu-Natal", "Limpopo",
+    "Mpumalanga", "North West", "Northern Cape", "Western Cape",
+)
+OTHER_REGION = "Other"
+_REGION_LOOKUP = {name.casefold(): name for name in REGIONS}
+
+# The model is asked for these, but its output is not guaranteed to match.
+SEVERITIES = ("mild", "moderate", "urgent")
+OTHER_SEVERITY = "other"
+
+GRANULARITIES = ("hour", "day")
+DIMENSIONS = ("severity", "keyword", "region")
+
+
+def extract_keywords(symptoms: str) -> list[str]:
+    text = symptoms.lower()
+    return [kw for kw, pattern in KEYWORD_PATTERNS.items() if pattern.search(text)]
+
+
+def normalize_region(region: str | None) -> str | None:
+    if region is None or not region.strip():
+        return None
+    return _REGION_LOOKUP.get(region.strip().casefold(), OTHER_REGION)
+
+
+def normalize_severity(severity: str) -> str:
+    severity = severity.strip().casefold()
+    return severity if severity in SEVERITIES else OTHER_SEVERITY
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    if granularity == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _bump_rollups(db: Session, rows: list[dict]) -> None:
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(TriageRollup).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["granularity", "dimension", "bucket_start", "value"],
+            set_={"count": TriageRollup.count + stmt.excluded["count"]},
+        )
+        db.execute(stmt)
+        return
+
+    for row in rows:
+        existing = db.execute(
+            select(TriageRollup).filter_by(
+                granularity=row["granularity"], dimension=row["dimension"],
+                bucket_start=row["bucket_start"], value=row["value"],
+            ).with_for_update()
+        ).scalar_one_or_none()
+        if existing:
+            existing.count += row["count"]
+        else:
+            db.add(TriageRollup(**row))
+
+
+def record_triage(db: Session, symptoms: str, severity: str, region: str | None = None) -> TriageEvent:
+    """Append a triage event and fold it into the hourly and daily rollups. Caller commits."""
+    keywords = extract_keywords(symptoms)
+    severity = normalize_severity(severity)
+    region = normalize_region(region)
+    event = TriageEvent(
+        severity=severity,
+        symptoms=symptoms,
+        keywords=",".join(keywords) or None,
+        region=region,
+        created_at=datetime.utcnow(),
+    )
+    db.add(event)
+
+    values = [("severity", severity)] + [("keyword", kw) for kw in keywords]
+    if region:
+        values.append(("region", region))
+    rows = [
+        {
+            "granularity": granularity,
+            "bucket_start": bucket_start(event.created_at, granularity),
+            "dimension": dimension,
+            "value": value,
+            "count": 1,
+        }
+        for granularity in GRANULARITIES
+        for dimension, value in values
+    ]
+    _bump_rollups(db, rows)
+    return event
@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Literal
+
+from anyio import from_thread
+from fastapi import Request
+from pydantic import ValidationError
+from sqlalchemy.sql import Select
+
+from .database import SessionLocal
+
+
+Format = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Undecodable bytes become U+FFFD so the row can be reported instead of aborting the import.
+ENCODING_ERROR = "not valid UTF-8; re-export the file as UTF-8"
+
+
+def iter_request_lines(request: Request) -> Iterator[str]:
+    """Yield body lines as they arrive. Must run in a worker thread (run_in_threadpool)."""
+    chunks = request.stream()
+
+    async def next_chunk():
+        return await anext(chunks, None)
+
+    buf = b""
+    while (chunk := from_thread.run(next_chunk)) is not None:
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8-sig", errors="replace") + "\n"
+    if buf:
+        yield buf.decode("utf-8-sig", errors="replace")
+
+
+def parse_records(lines: Iterable[str], fmt: Format) -> Iterator[tuple[int, dict | None, str | None]]:
+    """Yield (row number, record, error) for each data row of a CSV or NDJSON body."""
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            if any("\ufffd" in str(v) for v in record.values()):
+                yield reader.line_num, None, ENCODING_ERROR
+                continue
+            # Blank cells mean "not provided", same as a missing NDJSON key.
+            yield reader.line_num, {k: v for k, v in record.items() if v not in ("", None)}, None
+        return
+
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        if "\ufffd" in line:
+            yield number, None, ENCODING_ERROR
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield number, None, f"invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield number, None, "expected a JSON object"
+            continue
+        yield number, record, None
+
+
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def describe_error(e: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors())
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def stream_query(
+    stmt: Select,
+    columns: list[str],
+    fmt: Format,
+    transform: Callable[[dict], dict] | None = None,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    """Serialise the rows of stmt as CSV or NDJSON using a server-side cursor.
+
+    transform, if given, reshapes each NDJSON record before it is written.
+
+    Opens its own session: request-scoped dependencies are torn down before a
+    StreamingResponse body is sent.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=batch_size))
+        out = io.StringIO()
+        writer = csv.writer(out)
+        if fmt == "csv":
+            writer.writerow(columns)
+        for rows in result.partitions():
+            for row in rows:
+                if fmt == "csv":
+                    writer.writerow([_encode(v) for v in row])
+                else:
+                    record = {c: _encode(v) for c, v in zip(columns, row)}
+                    out.write(json.dumps(transform(record) if transform else record) + "\n")
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+        if fmt == "csv" and out.tell():
+            yield out.getvalue()
+    finally:
+        db.close()
@@ -29,6 +29,10 @@ class Settings(BaseSettings):
     alert_email_to: str | None = None
     alert_email_from: str | None = None
 
+    # Real-time alert push
+    alert_queue_size: int = 100
+    alert_broadcast_backend: str = "app.core.alerts.LocalBroadcast"
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from .config import get_settings
@@ -13,6 +13,18 @@ engine = create_engine(
     pool_pre_ping=True,
 )
 
+if engine.dialect.name == "sqlite":
+    # pysqlite defers BEGIN and so breaks SAVEPOINT (used by /sync/batch); let
+    # SQLAlchemy emit BEGIN itself, as recommended in the SQLAlchemy SQLite docs.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 
 Base = declarative_base()
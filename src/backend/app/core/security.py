@@ -34,6 +34,17 @@ def create_access_token(subject: str, expires_delta_minutes: int | None = None)
     return token
 
 
+def get_user_from_token(token: str, db: Session) -> User | None:
+    try:
+        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    except JWTError:
+        return None
+    email: str | None = payload.get("sub")
+    if email is None:
+        return None
+    return db.query(User).filter(User.email == email).first()
+
+
 def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[Session, Depends(get_db)],
@@ -43,15 +54,13 @@ def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        email: str | None = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
-    user = db.query(User).filter(User.email == email).first()
+    user = get_user_from_token(token, db)
     if not user:
         raise credentials_exception
-    return user
\ No newline at end of file
+    return user
+
+
+def get_current_superuser(current_user: Annotated[User, Depends(get_current_user)]):
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required")
+    return current_user
\ No newline at end of file
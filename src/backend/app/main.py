@@ -1,7 +1,10 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from .core.alerts import hub
 from .core.database import Base, engine
-from .routers import auth, triage, appointments, emergency, points, pdf, chat, testing
+from .routers import auth, triage, appointments, emergency, points, pdf, chat, testing, sync, admin
 
 app = FastAPI(title="Smart Clinic API", version="0.1.0")
 
@@ -24,6 +27,12 @@ def on_startup():
     Base.metadata.create_all(bind=engine)
 
 
+@app.on_event("startup")
+async def bind_alert_hub():
+    # Sync routes publish from the threadpool and need the server's event loop.
+    hub.bind(asyncio.get_running_loop())
+
+
 app.include_router(auth.router)
 app.include_router(triage.router)
 app.include_router(appointments.router)
@@ -32,5 +41,7 @@ app.include_router(points.router)
 app.include_router(pdf.router)
 app.include_router(chat.router)
 app.include_router(testing.router)
+app.include_router(sync.router)
+app.include_router(admin.router)
 
 
@@ -0,0 +1,53 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, UniqueConstraint, event, insert
+from sqlalchemy.orm import Session
+
+from ..core.database import Base
+from .appointment import Appointment
+from .emergency import EmergencyAlert
+from .reward import RewardPoint
+
+
+class SyncChange(Base):
+    """Append-only log of per-user record changes. Its id doubles as the sync token."""
+
+    __tablename__ = "sync_changes"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    entity = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class SyncReceipt(Base):
+    """Stored result of an idempotent batch operation, replayed on retry."""
+
+    __tablename__ = "sync_receipts"
+    __table_args__ = (UniqueConstraint("user_id", "idempotency_key"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    idempotency_key = Column(String, nullable=False)
+    result = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+TRACKED = {
+    Appointment: "appointment",
+    RewardPoint: "points",
+    EmergencyAlert: "alert",
+}
+
+
+@event.listens_for(Session, "after_flush")
+def record_changes(session, flush_context):
+    # Runs for every write path (single-item routes and /sync/batch alike) so
+    # the delta never misses a change made outside the batch endpoint.
+    rows = []
+    for obj in list(session.new) + [o for o in session.dirty if session.is_modified(o)]:
+        entity = TRACKED.get(type(obj))
+        if entity and obj.user_id is not None:
+            rows.append({"user_id": obj.user_id, "entity": entity, "entity_id": obj.id, "created_at": datetime.utcnow()})
+    if rows:
+        session.connection().execute(insert(SyncChange), rows)
@@ -0,0 +1,31 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Text, UniqueConstraint
+
+from ..core.database import Base
+
+
+class TriageEvent(Base):
+    """Raw triage outcome. Append-only; never updated after insert."""
+
+    __tablename__ = "triage_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    severity = Column(String, nullable=False)
+    symptoms = Column(Text, nullable=False)
+    keywords = Column(String, nullable=True)  # comma separated, see core.analytics.SYMPTOM_KEYWORDS
+    region = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class TriageRollup(Base):
+    """Event count for one (bucket, dimension, value), kept current on every insert."""
+
+    __tablename__ = "triage_rollups"
+    __table_args__ = (UniqueConstraint("granularity", "dimension", "bucket_start", "value"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    granularity = Column(String, nullable=False)  # hour | day
+    bucket_start = Column(DateTime, nullable=False)
+    dimension = Column(String, nullable=False)  # severity | keyword | region
+    value = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
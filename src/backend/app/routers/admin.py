@@ -0,0 +1,158 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from ..core.bulk import (
+    Format, MEDIA_TYPES, batched, describe_error, iter_request_lines, parse_records, stream_query,
+)
+from ..core.database import get_db
+from ..core.security import get_current_superuser, get_password_hash, pwd_context
+from ..models.appointment import Appointment
+from ..models.sync import SyncChange
+from ..models.user import User
+from ..schemas.admin import AppointmentImport, ImportReport, UserImport
+
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+BATCH_SIZE = 1000
+
+# bcrypt releases the GIL, so threads hash in parallel across cores.
+hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+
+def validate_batch(batch, schema, report: ImportReport) -> list[tuple[int, BaseModel]]:
+    valid = []
+    for row, record, error in batch:
+        if error:
+            report.fail(row, error)
+            continue
+        try:
+            valid.append((row, schema.model_validate(record)))
+        except ValidationError as e:
+            report.fail(row, describe_error(e))
+    return valid
+
+
+def import_users(db: Session, lines, fmt: Format) -> ImportReport:
+    report = ImportReport()
+    for batch in batched(parse_records(lines, fmt), BATCH_SIZE):
+        emails = set()
+        pending = []
+        for row, user in validate_batch(batch, UserImport, report):
+            if not user.password and not user.hashed_password:
+                report.fail(row, "password: Field required")
+            elif user.password and user.hashed_password:
+                report.fail(row, "give either password or hashed_password, not both")
+            elif user.hashed_password and pwd_context.identify(user.hashed_password) != "bcrypt":
+                # Anything else would make /auth/login raise UnknownHashError for this user.
+                report.fail(row, "hashed_password: not a bcrypt hash")
+            elif user.email in emails:
+                report.fail(row, "Email duplicated in file")
+            else:
+                emails.add(user.email)
+                pending.append((row, user))
+
+        taken = set(db.scalars(select(User.email).where(User.email.in_(emails))))
+        for row, user in pending:
+            if user.email in taken:
+                report.fail(row, "Email already registered")
+        pending = [(row, user) for row, user in pending if user.email not in taken]
+        if not pending:
+            continue
+
+        to_hash = [user.password for _, user in pending if not user.hashed_password]
+        hashes = iter(hash_pool.map(get_password_hash, to_hash))
+        rows = [
+            {
+                "email": user.email,
+                "full_name": user.full_name,
+                "hashed_password": user.hashed_password or next(hashes),
+            }
+            for _, user in pending
+        ]
+        db.execute(insert(User), rows)
+        db.commit()
+        report.inserted += len(rows)
+    report.errors.sort(key=lambda e: e["row"])
+    return report
+
+
+def import_appointments(db: Session, lines, fmt: Format) -> ImportReport:
+    report = ImportReport()
+    for batch in batched(parse_records(lines, fmt), BATCH_SIZE):
+        valid = validate_batch(batch, AppointmentImport, report)
+        emails = {appt.user_email for _, appt in valid}
+        user_ids = dict(db.execute(select(User.email, User.id).where(User.email.in_(emails))).all())
+
+        rows = []
+        for row, appt in valid:
+            if appt.user_email not in user_ids:
+                report.fail(row, "Unknown user_email")
+                continue
+            rows.append({"user_id": user_ids[appt.user_email]} | appt.model_dump(exclude={"user_email"}))
+        if not rows:
+            continue
+
+        created = db.execute(insert(Appointment).returning(Appointment.id, Appointment.user_id), rows).all()
+        # Core inserts bypass the ORM flush hook, so log the changes for /sync/batch here.
+        db.execute(
+            insert(SyncChange),
+            [{"user_id": user_id, "entity": "appointment", "entity_id": appt_id} for appt_id, user_id in created],
+        )
+        db.commit()
+        report.inserted += len(rows)
+    report.errors.sort(key=lambda e: e["row"])
+    return report
+
+
+@router.post("/import/users", response_model=ImportReport)
+async def bulk_import_users(
+    request: Request,
+    format: Format = "csv",
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Create users from a streamed CSV/NDJSON body (email, full_name, password or hashed_password)."""
+    return await run_in_threadpool(import_users, db, iter_request_lines(request), format)
+
+
+@router.post("/import/appointments", response_model=ImportReport)
+async def bulk_import_appointments(
+    request: Request,
+    format: Format = "csv",
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Create appointments from a streamed CSV/NDJSON body keyed by user_email."""
+    return await run_in_threadpool(import_appointments, db, iter_request_lines(request), format)
+
+
+@router.get("/export/users")
+def bulk_export_users(format: Format = "csv", current_user=Depends(get_current_superuser)):
+    columns = ["id", "email", "full_name", "is_active", "is_superuser", "created_at"]
+    stmt = select(*(getattr(User, c) for c in columns)).order_by(User.id)
+    return StreamingResponse(stream_query(stmt, columns, format), media_type=MEDIA_TYPES[format])
+
+
+@router.get("/export/appointments")
+def bulk_export_appointments(format: Format = "csv", current_user=Depends(get_current_superuser)):
+    stmt = (
+        select(
+            Appointment.id, User.email, Appointment.clinic_name, Appointment.clinic_location, Appointment.time_slot,
+            Appointment.status, Appointment.symptoms, Appointment.ai_recommendation, Appointment.created_at,
+        )
+        .join(User, Appointment.user_id == User.id)
+        .order_by(Appointment.id)
+    )
+    columns = [
+        "id", "user_email", "clinic_name", "clinic_location", "time_slot",
+        "status", "symptoms", "ai_recommendation", "created_at",
+    ]
+    return StreamingResponse(stream_query(stmt, columns, format), media_type=MEDIA_TYPES[format])
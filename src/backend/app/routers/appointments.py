@@ -10,14 +10,9 @@ from ..schemas.appointment import AppointmentCreate, AppointmentRead
 router = APIRouter(prefix="/appointments", tags=["appointments"])
 
 
-@router.post("/", response_model=AppointmentRead)
-def create_appointment(
-    payload: AppointmentCreate,
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user),
-):
+def book_appointment(db: Session, user, payload: AppointmentCreate) -> Appointment:
     appt = Appointment(
-        user_id=current_user.id,
+        user_id=user.id,
         clinic_name=payload.clinic_name,
         clinic_location=payload.clinic_location,
         time_slot=payload.time_slot,
@@ -26,6 +21,24 @@ def create_appointment(
         ai_recommendation=payload.ai_recommendation,
     )
     db.add(appt)
+    return appt
+
+
+def mark_cancelled(db: Session, user, appointment_id: int) -> Appointment:
+    appt = db.query(Appointment).filter(Appointment.id == appointment_id, Appointment.user_id == user.id).first()
+    if not appt:
+        raise HTTPException(status_code=404, detail="Appointment not found")
+    appt.status = "cancelled"
+    return appt
+
+
+@router.post("/", response_model=AppointmentRead)
+def create_appointment(
+    payload: AppointmentCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    appt = book_appointment(db, current_user, payload)
     db.commit()
     db.refresh(appt)
     return appt
@@ -44,9 +57,6 @@ def list_upcoming(db: Session = Depends(get_db), current_user=Depends(get_curren
 
 @router.delete("/{appointment_id}")
 def cancel_appointment(appointment_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    appt = db.query(Appointment).filter(Appointment.id == appointment_id, Appointment.user_id == current_user.id).first()
-    if not appt:
-        raise HTTPException(status_code=404, detail="Appointment not found")
-    appt.status = "cancelled"
+    mark_cancelled(db, current_user, appointment_id)
     db.commit()
     return {"ok": True}
\ No newline at end of file
@@ -1,20 +1,79 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, WebSocket, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from ..core.database import get_db
-from ..core.security import get_current_user
+from ..core.alerts import hub
+from ..core.database import get_db, SessionLocal
+from ..core.security import get_current_user, get_user_from_token
 from ..models.emergency import EmergencyAlert
-from ..schemas.emergency import EmergencyCreate, EmergencyRead
+from ..schemas.emergency import EmergencyAlertEvent, EmergencyCreate, EmergencyRead
 
 
 router = APIRouter(prefix="/emergency", tags=["emergency"])
 
 
+def raise_alert(db: Session, user, payload: EmergencyCreate) -> EmergencyAlert:
+    alert = EmergencyAlert(user_id=user.id, location=payload.location, summary=payload.summary, status="sent")
+    db.add(alert)
+    return alert
+
+
+def broadcast_alert(alert: EmergencyAlert) -> None:
+    """Push a committed alert to connected responders."""
+    hub.publish_threadsafe(EmergencyAlertEvent.model_validate(alert).model_dump(mode="json"))
+
+
 @router.post("/alert", response_model=EmergencyRead)
 def send_alert(payload: EmergencyCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    alert = EmergencyAlert(user_id=current_user.id, location=payload.location, summary=payload.summary, status="sent")
-    db.add(alert)
+    alert = raise_alert(db, current_user, payload)
     db.commit()
     db.refresh(alert)
+    broadcast_alert(alert)
     # Placeholder: integrate with SMS/email providers
-    return alert
\ No newline at end of file
+    return alert
+
+
+def authenticate_responder(token: str):
+    db = SessionLocal()
+    try:
+        return get_user_from_token(token, db)
+    finally:
+        db.close()
+
+
+@router.websocket("/ws")
+async def subscribe_alerts(websocket: WebSocket, token: str):
+    """Push new emergency alerts to responders. Authenticate with ?token=<jwt>."""
+    user = await run_in_threadpool(authenticate_responder, token)
+    if not user or not user.is_superuser:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    sub = hub.subscribe()
+
+    async def pump():
+        while True:
+            message = await sub.queue.get()
+            # Tell a slow client how many alerts it missed before sending the next one.
+            if dropped := sub.take_dropped():
+                await websocket.send_text(json.dumps({"type": "gap", "dropped": dropped}))
+            await websocket.send_text(message)
+
+    async def drain():
+        # Clients don't send anything; reading only surfaces the disconnect.
+        while True:
+            await websocket.receive_text()
+
+    tasks = [asyncio.create_task(pump()), asyncio.create_task(drain())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        hub.unsubscribe(sub)
+        for task in tasks:
+            task.cancel()
+        # Collects the WebSocketDisconnect / cancellation from both loops.
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -10,10 +10,15 @@ from ..schemas.points import PointsCreate, PointsRead
 router = APIRouter(prefix="/points", tags=["points"])
 
 
+def add_points(db: Session, user, payload: PointsCreate) -> RewardPoint:
+    entry = RewardPoint(user_id=user.id, points=payload.points, reason=payload.reason)
+    db.add(entry)
+    return entry
+
+
 @router.post("/earn", response_model=PointsRead)
 def earn_points(payload: PointsCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    entry = RewardPoint(user_id=current_user.id, points=payload.points, reason=payload.reason)
-    db.add(entry)
+    entry = add_points(db, current_user, payload)
     db.commit()
     db.refresh(entry)
     return entry
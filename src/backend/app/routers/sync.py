@@ -0,0 +1,132 @@
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import ValidationError
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..core.database import get_db
+from ..core.security import get_current_user
+from ..models.appointment import Appointment
+from ..models.emergency import EmergencyAlert
+from ..models.reward import RewardPoint
+from ..models.sync import SyncChange, SyncReceipt
+from ..schemas.appointment import AppointmentCreate, AppointmentRead
+from ..schemas.emergency import EmergencyCreate, EmergencyRead
+from ..schemas.points import PointsCreate, PointsRead
+from ..schemas.sync import AppointmentCancel, SyncBatch, SyncDelta, SyncResponse, SyncResult
+from .appointments import book_appointment, mark_cancelled
+from .emergency import broadcast_alert, raise_alert
+from .points import add_points
+
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+# op -> (input schema, handler, output schema)
+OPERATIONS = {
+    "appointment.create": (AppointmentCreate, book_appointment, AppointmentRead),
+    "appointment.cancel": (AppointmentCancel, lambda db, user, data: mark_cancelled(db, user, data.appointment_id), AppointmentRead),
+    "points.earn": (PointsCreate, add_points, PointsRead),
+    "emergency.alert": (EmergencyCreate, raise_alert, EmergencyRead),
+}
+
+DELTA = {
+    "appointment": ("appointments", Appointment, AppointmentRead),
+    "points": ("points", RewardPoint, PointsRead),
+    "alert": ("alerts", EmergencyAlert, EmergencyRead),
+}
+
+
+def collect_changes(db: Session, user, since: int | None, until: int) -> SyncDelta:
+    delta = SyncDelta()
+    if since is None:
+        # First sync: the client has nothing yet, send every record it owns.
+        ids = {entity: None for entity in DELTA}
+    else:
+        ids = {}
+        rows = (
+            db.query(SyncChange.entity, SyncChange.entity_id)
+            .filter(SyncChange.user_id == user.id, SyncChange.id > since, SyncChange.id <= until)
+            .distinct()
+            .all()
+        )
+        for entity, entity_id in rows:
+            ids.setdefault(entity, []).append(entity_id)
+
+    for entity, entity_ids in ids.items():
+        if entity not in DELTA:
+            continue
+        field, model, read = DELTA[entity]
+        query = db.query(model).filter(model.user_id == user.id)
+        if entity_ids is not None:
+            query = query.filter(model.id.in_(entity_ids))
+        setattr(delta, field, [read.model_validate(obj) for obj in query.order_by(model.id).all()])
+    return delta
+
+
+@router.post("/batch", response_model=SyncResponse)
+def sync_batch(payload: SyncBatch, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    """Replay queued offline operations in order, in one transaction, and return what changed since sync_token."""
+    keys = {op.idempotency_key for op in payload.operations if op.idempotency_key}
+    receipts = {}
+    if keys:
+        stored = (
+            db.query(SyncReceipt)
+            .filter(SyncReceipt.user_id == current_user.id, SyncReceipt.idempotency_key.in_(keys))
+            .all()
+        )
+        receipts = {r.idempotency_key: r.result for r in stored}
+
+    results = []
+    alerts = []
+    for op in payload.operations:
+        key = op.idempotency_key
+        if key in receipts:
+            result = SyncResult.model_validate_json(receipts[key])
+            result.replayed = True
+            results.append(result)
+            continue
+
+        schema, handler, read = OPERATIONS[op.op]
+        try:
+            data = schema.model_validate(op.data)
+            # Each op gets a savepoint so a failing one is undone without
+            # discarding the ops already applied earlier in the batch.
+            with db.begin_nested():
+                obj = handler(db, current_user, data)
+                db.flush()
+                result = SyncResult(
+                    idempotency_key=key, status_code=200, data=read.model_validate(obj).model_dump(mode="json"),
+                )
+                # Only successes are remembered, so a failed op can be retried once fixed.
+                if key:
+                    db.add(SyncReceipt(user_id=current_user.id, idempotency_key=key, result=result.model_dump_json()))
+                    db.flush()
+        except ValidationError as e:
+            results.append(SyncResult(idempotency_key=key, status_code=422, error=str(e)))
+            continue
+        except HTTPException as e:
+            results.append(SyncResult(idempotency_key=key, status_code=e.status_code, error=e.detail))
+            continue
+        except IntegrityError:
+            # Usually a concurrent retry that already stored this idempotency key.
+            results.append(SyncResult(idempotency_key=key, status_code=409, error="Conflicting write, retry the operation"))
+            continue
+        except (SQLAlchemyError, OverflowError) as e:
+            # pysqlite raises OverflowError for out-of-range integers before SQLAlchemy can wrap it.
+            results.append(SyncResult(idempotency_key=key, status_code=500, error=f"Database error: {type(e).__name__}"))
+            continue
+
+        if key:
+            receipts[key] = result.model_dump_json()
+        if isinstance(obj, EmergencyAlert):
+            alerts.append(obj)
+        results.append(result)
+
+    db.commit()
+    for alert in alerts:
+        broadcast_alert(alert)
+
+    token = db.query(func.max(SyncChange.id)).filter(SyncChange.user_id == current_user.id).scalar() or 0
+    changes = collect_changes(db, current_user, payload.sync_token, token)
+    return SyncResponse(results=results, changes=changes, sync_token=token)
@@ -1,11 +1,21 @@
 import json
+import logging
+from datetime import datetime
+from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 import google.generativeai as genai
 
+from ..core.analytics import record_triage
+from ..core.bulk import MEDIA_TYPES, stream_query
 from ..core.database import get_db
 from ..core.config import get_settings
-from ..schemas.triage import SymptomInput, TriageResult
+from ..core.security import get_current_superuser
+from ..models.triage import TriageEvent, TriageRollup
+from ..schemas.triage import SymptomInput, TriageResult, TriageRollupRead
 
 # AI Configuration
 settings = get_settings()
@@ -18,6 +28,7 @@ genai.configure(
 model = genai.GenerativeModel('gemini-1.5-flash-latest') # Using a newer, faster model
 
 router = APIRouter(prefix="/triage", tags=["triage"])
+logger = logging.getLogger(__name__)
 
 #prompt engineering
 SYSTEM_PROMPT = """
@@ -74,5 +85,54 @@ def check_symptoms(
     if not payload.symptoms:
         raise HTTPException(status_code=400, detail="Symptoms must be provided.")
     triage_result = get_ai_triage(payload)
-    
-    return triage_result
\ No newline at end of file
+    # Analytics must never cost the patient their triage result.
+    try:
+        record_triage(db, payload.symptoms, triage_result.severity, payload.region)
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.exception("Failed to record triage analytics")
+
+    return triage_result
+
+
+@router.get("/analytics", response_model=list[TriageRollupRead])
+def triage_trends(
+    dimension: Literal["severity", "keyword", "region"] = "severity",
+    granularity: Literal["hour", "day"] = "day",
+    start: datetime | None = None,
+    end: datetime | None = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """Read pre-aggregated counts; never touches the raw event table."""
+    query = db.query(TriageRollup).filter(TriageRollup.granularity == granularity, TriageRollup.dimension == dimension)
+    if start:
+        query = query.filter(TriageRollup.bucket_start >= start)
+    if end:
+        query = query.filter(TriageRollup.bucket_start < end)
+    return query.order_by(TriageRollup.bucket_start, TriageRollup.value).all()
+
+
+@router.get("/analytics/export")
+def export_triage_events(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    current_user=Depends(get_current_superuser),
+):
+    """Stream raw triage events as NDJSON for offline analysis."""
+    columns = ["id", "severity", "symptoms", "keywords", "region", "created_at"]
+    stmt = select(*(getattr(TriageEvent, c) for c in columns)).order_by(TriageEvent.id)
+    if start:
+        stmt = stmt.where(TriageEvent.created_at >= start)
+    if end:
+        stmt = stmt.where(TriageEvent.created_at < end)
+
+    def split_keywords(record: dict) -> dict:
+        record["keywords"] = record["keywords"].split(",") if record["keywords"] else []
+        return record
+
+    return StreamingResponse(
+        stream_query(stmt, columns, "ndjson", transform=split_keywords),
+        media_type=MEDIA_TYPES["ndjson"],
+    )
\ No newline at end of file
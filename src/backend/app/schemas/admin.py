@@ -0,0 +1,30 @@
+from pydantic import BaseModel, EmailStr
+
+from .appointment import AppointmentCreate
+from .user import UserBase
+
+
+MAX_REPORTED_ERRORS = 1000
+
+
+class UserImport(UserBase):
+    """Either a plain password (hashed here) or an existing bcrypt hash (migrations)."""
+
+    password: str | None = None
+    hashed_password: str | None = None
+
+
+class AppointmentImport(AppointmentCreate):
+    user_email: EmailStr
+    status: str = "booked"
+
+
+class ImportReport(BaseModel):
+    inserted: int = 0
+    failed: int = 0
+    errors: list[dict] = []
+
+    def fail(self, row: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": error})
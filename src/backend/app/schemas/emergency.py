@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -13,4 +16,11 @@ class EmergencyRead(BaseModel):
     status: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class EmergencyAlertEvent(EmergencyRead):
+    """Message pushed to responders over /emergency/ws."""
+
+    type: Literal["alert"] = "alert"
+    created_at: datetime
\ No newline at end of file
@@ -0,0 +1,42 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from .appointment import AppointmentRead
+from .emergency import EmergencyRead
+from .points import PointsRead
+
+
+class SyncOperation(BaseModel):
+    op: Literal["appointment.create", "appointment.cancel", "points.earn", "emergency.alert"]
+    idempotency_key: str | None = None
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
+class AppointmentCancel(BaseModel):
+    appointment_id: int
+
+
+class SyncBatch(BaseModel):
+    operations: list[SyncOperation] = Field(max_length=500)
+    sync_token: int | None = None
+
+
+class SyncResult(BaseModel):
+    idempotency_key: str | None = None
+    status_code: int
+    data: dict[str, Any] | None = None
+    error: str | None = None
+    replayed: bool = False
+
+
+class SyncDelta(BaseModel):
+    appointments: list[AppointmentRead] = []
+    points: list[PointsRead] = []
+    alerts: list[EmergencyRead] = []
+
+
+class SyncResponse(BaseModel):
+    results: list[SyncResult]
+    changes: SyncDelta
+    sync_token: int
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 
 
 class SymptomInput(BaseModel):
@@ -8,9 +10,19 @@ class SymptomInput(BaseModel):
     systolic_bp: int | None = None
     diastolic_bp: int | None = None
     spo2: int | None = None
+    region: str | None = Field(default=None, max_length=64)
 
 
 class TriageResult(BaseModel):
     severity: str  # mild | moderate | urgent
     recommendation: str
-    reasons: list[str]
\ No newline at end of file
+    reasons: list[str]
+
+
+class TriageRollupRead(BaseModel):
+    bucket_start: datetime
+    value: str
+    count: int
+
+    class Config:
+        from_attributes = True
\ No newline at end of file